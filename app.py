@@ -118,6 +118,13 @@ with col2:
                 include_idioms=include_idioms
             )
             
+            if translation_result.get("fallback"):
+                st.warning(
+                    "The translation service is busy, so this was translated by the local model. "
+                    f"It assumes the input is in {os.getenv('LOCAL_SOURCE_LANGUAGE', 'English')} "
+                    "and does not include cultural context or idioms."
+                )
+            
             # Display translation
             if translation_result["translation"]:
                 st.text_area(
@@ -0,0 +1,92 @@
+from typing import Callable, List, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import queue
+import threading
+import time
+
+
+class BatchScheduler:
+    """Groups concurrent sentence requests into batched forward passes."""
+
+    def __init__(
+        self,
+        translate_batch: Callable[[Tuple[str, str], List[str]], List[str]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0,
+        num_workers: int = 2
+    ):
+        self.translate_batch = translate_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.requests = queue.Queue()
+        self.idle_workers = threading.Semaphore(num_workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=num_workers,
+            thread_name_prefix="local-translation"
+        )
+        self.scheduler_thread = threading.Thread(target=self._run, daemon=True)
+        self.scheduler_thread.start()
+
+    def submit(self, language_pair: Tuple[str, str], sentence: str) -> Future:
+        """Queue a single sentence and return a future for its translation."""
+        future = Future()
+        self.requests.put((language_pair, sentence, future))
+        return future
+
+    def _run(self) -> None:
+        """Collect requests until the batch is full or the wait window closes."""
+        while True:
+            batch = [self.requests.get()]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # Keep growing the batch while every worker is busy
+            while not self.idle_workers.acquire(timeout=self.max_wait):
+                self._fill(batch)
+            self._fill(batch)
+
+            # A forward pass can only use one model, so split by language pair
+            groups = {}
+            for language_pair, sentence, future in batch:
+                groups.setdefault(language_pair, []).append((sentence, future))
+
+            for index, (language_pair, items) in enumerate(groups.items()):
+                # The first group takes the worker acquired above
+                if index > 0:
+                    self.idle_workers.acquire()
+                self.executor.submit(self._process, language_pair, items)
+
+    def _fill(self, batch: List) -> None:
+        """Add already queued requests to the batch without waiting."""
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.requests.get_nowait())
+            except queue.Empty:
+                break
+
+    def _process(self, language_pair: Tuple[str, str], items: List) -> None:
+        """Run one batched forward pass and resolve the waiting futures."""
+        sentences = [sentence for sentence, _ in items]
+        try:
+            translations = self.translate_batch(language_pair, sentences)
+            if len(translations) != len(sentences):
+                raise RuntimeError(
+                    f"Expected {len(sentences)} translations, got {len(translations)}"
+                )
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            return
+        finally:
+            self.idle_workers.release()
+
+        for (_, future), translation in zip(items, translations):
+            future.set_result(translation)
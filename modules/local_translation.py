@@ -0,0 +1,262 @@
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import wait
+import os
+import re
+import threading
+import torch
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from dotenv import load_dotenv
+from modules.batching import BatchScheduler
+
+# Load environment variables
+load_dotenv()
+
+# Language names used in the UI mapped to ISO 639-1 codes
+LANGUAGE_CODES = {
+    "english": "en",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "italian": "it",
+    "portuguese": "pt",
+    "russian": "ru",
+    "chinese": "zh",
+    "japanese": "ja",
+    "korean": "ko",
+    "hindi": "hi",
+    "arabic": "ar",
+    "tamil": "ta",
+}
+
+# Language codes used by the NLLB-200 tokenizer
+NLLB_CODES = {
+    "en": "eng_Latn",
+    "es": "spa_Latn",
+    "fr": "fra_Latn",
+    "de": "deu_Latn",
+    "it": "ita_Latn",
+    "pt": "por_Latn",
+    "ru": "rus_Cyrl",
+    "zh": "zho_Hans",
+    "ja": "jpn_Jpan",
+    "ko": "kor_Hang",
+    "hi": "hin_Deva",
+    "ar": "arb_Arab",
+    "ta": "tam_Taml",
+}
+
+# Pairs with a dedicated general-domain MarianMT model. Every other pair
+# between supported languages goes through NLLB.
+MARIAN_MODELS = {
+    ("en", "es"): "Helsinki-NLP/opus-mt-en-es",
+    ("en", "fr"): "Helsinki-NLP/opus-mt-en-fr",
+    ("en", "de"): "Helsinki-NLP/opus-mt-en-de",
+    ("en", "it"): "Helsinki-NLP/opus-mt-en-it",
+    ("en", "ru"): "Helsinki-NLP/opus-mt-en-ru",
+    ("en", "hi"): "Helsinki-NLP/opus-mt-en-hi",
+    ("es", "en"): "Helsinki-NLP/opus-mt-es-en",
+    ("fr", "en"): "Helsinki-NLP/opus-mt-fr-en",
+    ("de", "en"): "Helsinki-NLP/opus-mt-de-en",
+    ("it", "en"): "Helsinki-NLP/opus-mt-it-en",
+    ("ru", "en"): "Helsinki-NLP/opus-mt-ru-en",
+    ("hi", "en"): "Helsinki-NLP/opus-mt-hi-en",
+    ("zh", "en"): "Helsinki-NLP/opus-mt-zh-en",
+    ("ja", "en"): "Helsinki-NLP/opus-mt-ja-en",
+    ("ko", "en"): "Helsinki-NLP/opus-mt-ko-en",
+    ("ar", "en"): "Helsinki-NLP/opus-mt-ar-en",
+}
+
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?。！？])\s+")
+
+_local_translator = None
+_local_translator_lock = threading.Lock()
+
+
+def get_local_translator() -> "LocalTranslator":
+    """
+    Return the process-wide LocalTranslator.
+
+    Streamlit reruns the app script on every interaction, so sharing one
+    instance keeps a single scheduler and model cache for all sessions.
+    This also lets concurrent requests land in the same batches.
+    """
+    global _local_translator
+    with _local_translator_lock:
+        if _local_translator is None:
+            _local_translator = LocalTranslator()
+        return _local_translator
+
+
+class LocalTranslator:
+    def __init__(self, source_language: Optional[str] = None):
+        self.source_language = source_language or os.getenv("LOCAL_SOURCE_LANGUAGE", "English")
+        self.nllb_model = os.getenv("LOCAL_NLLB_MODEL", "facebook/nllb-200-distilled-600M")
+        self.max_length = int(os.getenv("LOCAL_MAX_LENGTH", "512"))
+        self.timeout = float(os.getenv("LOCAL_TIMEOUT_SECONDS", "300"))
+        num_workers = int(os.getenv("LOCAL_NUM_WORKERS", "2"))
+
+        # Split the cores between workers so concurrent generate() calls
+        # don't each try to use every core
+        self.torch_threads = int(
+            os.getenv("LOCAL_TORCH_THREADS") or max(1, (os.cpu_count() or 1) // num_workers)
+        )
+        self.torch_configured = False
+
+        self.models = {}
+        self.tokenizers = {}
+        self.load_locks = {}
+        self.load_locks_lock = threading.Lock()
+        self.scheduler = BatchScheduler(
+            self._translate_batch,
+            max_batch_size=int(os.getenv("LOCAL_MAX_BATCH_SIZE", "16")),
+            max_wait_ms=float(os.getenv("LOCAL_MAX_WAIT_MS", "10")),
+            num_workers=num_workers
+        )
+
+    def translate(
+        self,
+        text: str,
+        target_language: str,
+        style: str = "informal",
+        include_cultural_context: bool = True,
+        include_idioms: bool = True,
+        source_language: Optional[str] = None
+    ) -> Dict:
+        """
+        Translate text to target language using a local seq2seq model.
+
+        Style, cultural context and idioms are not supported by plain
+        translation models, so the corresponding sections are left empty.
+        The source language is not detected: text is assumed to be in
+        source_language, or LOCAL_SOURCE_LANGUAGE (English) if not given.
+
+        Args:
+            text: Input text to translate
+            target_language: Target language for translation
+            style: Translation style (ignored)
+            include_cultural_context: Whether to include cultural context (ignored)
+            include_idioms: Whether to include idiomatic expressions (ignored)
+            source_language: Language of the input text
+
+        Returns:
+            Dictionary containing translation and additional information
+        """
+        language_pair = self.language_pair(target_language, source_language)
+
+        if language_pair[0] == language_pair[1]:
+            return {"translation": text.strip(), "cultural_context": "", "idioms": ""}
+
+        # Submit every sentence before waiting so the whole text can share batches
+        line_futures = []
+        for line in text.split("\n"):
+            sentences = [s for s in SENTENCE_PATTERN.split(line.strip()) if s]
+            line_futures.append([self.scheduler.submit(language_pair, s) for s in sentences])
+
+        _, pending = wait(
+            [future for futures in line_futures for future in futures],
+            timeout=self.timeout
+        )
+        if pending:
+            raise TimeoutError(f"Local translation did not finish within {self.timeout:g} seconds")
+
+        translated_lines = [
+            " ".join(future.result() for future in futures)
+            for futures in line_futures
+        ]
+
+        return {
+            "translation": "\n".join(translated_lines).strip(),
+            "cultural_context": "",
+            "idioms": ""
+        }
+
+    def language_pair(
+        self,
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Resolve the (source, target) language codes used for a translation.
+
+        Args:
+            target_language: Target language for translation
+            source_language: Language of the input text
+
+        Returns:
+            Tuple of ISO 639-1 source and target codes
+        """
+        return (
+            self._language_code(source_language or self.source_language),
+            self._language_code(target_language)
+        )
+
+    def _language_code(self, language: str) -> str:
+        """Map a language name (or code) to its ISO 639-1 code."""
+        language = language.strip().lower()
+        code = LANGUAGE_CODES.get(language, language)
+        if code not in NLLB_CODES:
+            raise ValueError(f"Language not supported by the local backend: {language}")
+        return code
+
+    def _load_model(self, language_pair: Tuple[str, str]):
+        """Load the tokenizer and model for a language pair on first use."""
+        source, _ = language_pair
+        model_name = MARIAN_MODELS.get(language_pair, self.nllb_model)
+        # NLLB tokenizers are bound to a source language, so keep one per source
+        tokenizer_key = (model_name, source)
+
+        if model_name not in self.models or tokenizer_key not in self.tokenizers:
+            # Only callers waiting for this model block while it downloads
+            with self.load_locks_lock:
+                load_lock = self.load_locks.setdefault(model_name, threading.Lock())
+                # The thread count is process-wide, so leave it alone until the
+                # local backend is actually used (e.g. not while Groq is healthy)
+                if not self.torch_configured:
+                    torch.set_num_threads(self.torch_threads)
+                    self.torch_configured = True
+
+            with load_lock:
+                if model_name not in self.models:
+                    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+                    model.eval()
+                    self.models[model_name] = model
+
+                if tokenizer_key not in self.tokenizers:
+                    if language_pair in MARIAN_MODELS:
+                        tokenizer = AutoTokenizer.from_pretrained(model_name)
+                    else:
+                        tokenizer = AutoTokenizer.from_pretrained(model_name, src_lang=NLLB_CODES[source])
+                    # Fast tokenizers can't encode on two threads at once, and batches
+                    # for the same pair may run on different workers
+                    self.tokenizers[tokenizer_key] = (tokenizer, threading.Lock())
+
+        tokenizer, tokenizer_lock = self.tokenizers[tokenizer_key]
+        return tokenizer, tokenizer_lock, self.models[model_name]
+
+    def _translate_batch(
+        self,
+        language_pair: Tuple[str, str],
+        sentences: List[str]
+    ) -> List[str]:
+        """Translate a batch of sentences in a single forward pass."""
+        tokenizer, tokenizer_lock, model = self._load_model(language_pair)
+        generate_kwargs = {"max_length": self.max_length}
+
+        with tokenizer_lock:
+            inputs = tokenizer(
+                sentences,
+                return_tensors="pt",
+                padding=True,
+                truncation=True
+            )
+            if language_pair not in MARIAN_MODELS:
+                # NLLB picks the output language from the first generated token
+                generate_kwargs["forced_bos_token_id"] = tokenizer.convert_tokens_to_ids(
+                    NLLB_CODES[language_pair[1]]
+                )
+
+        with torch.inference_mode():
+            outputs = model.generate(**inputs, **generate_kwargs)
+
+        with tokenizer_lock:
+            return tokenizer.batch_decode(outputs, skip_special_tokens=True)
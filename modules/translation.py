@@ -2,6 +2,7 @@ from typing import List, Dict, Optional
 from langchain_groq import ChatGroq
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema import SystemMessage, HumanMessage
+from groq import APIConnectionError, RateLimitError
 import os
 from dotenv import load_dotenv
 
@@ -9,7 +10,23 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Translator:
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, backend: str = None):
+        if backend is None:
+            backend = os.getenv("TRANSLATION_BACKEND", "groq")
+        self.backend = backend.lower()
+        if self.backend not in ("groq", "local"):
+            raise ValueError(f"Unsupported TRANSLATION_BACKEND: {backend} (expected groq or local)")
+
+        # The local backend is also used as a fallback when Groq is throttled
+        self.local_translator = None
+        if self.backend == "local" or os.getenv("LOCAL_FALLBACK", "false").lower() == "true":
+            from modules.local_translation import get_local_translator
+            self.local_translator = get_local_translator()
+
+        if self.backend == "local":
+            self.llm = None
+            return
+
         if model_name is None:
             model_name = os.getenv("DEFAULT_MODEL", "llama3-70b-8192")
             
@@ -43,8 +60,19 @@ class Translator:
             include_idioms: Whether to include idiomatic expressions
             
         Returns:
-            Dictionary containing translation and additional information
+            Dictionary containing translation and additional information.
+            "fallback" is set when Groq was unavailable and the local
+            backend produced the translation instead.
         """
+        if self.backend == "local":
+            return self.local_translator.translate(
+                text,
+                target_language,
+                style=style,
+                include_cultural_context=include_cultural_context,
+                include_idioms=include_idioms
+            )
+
         # Create the translation prompt
         system_prompt = f"""You are an expert translator and cultural consultant. 
         Your task is to translate the following text to {target_language} in a {style} style.
@@ -73,7 +101,27 @@ class Translator:
         ]
         
         # Get translation from LLM
-        response = self.llm.invoke(messages)
+        try:
+            response = self.llm.invoke(messages)
+        except (RateLimitError, APIConnectionError):
+            if self.local_translator is None:
+                raise
+
+            # Groq accepts any input language but the local models assume
+            # LOCAL_SOURCE_LANGUAGE, so never hand the input back unchanged
+            source, target = self.local_translator.language_pair(target_language)
+            if source == target:
+                raise
+
+            result = self.local_translator.translate(
+                text,
+                target_language,
+                style=style,
+                include_cultural_context=include_cultural_context,
+                include_idioms=include_idioms
+            )
+            result["fallback"] = True
+            return result
         
         # Parse response into sections
         sections = self._parse_response(response.content)
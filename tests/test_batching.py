@@ -0,0 +1,101 @@
+import threading
+import time
+import pytest
+from modules.batching import BatchScheduler
+
+
+class RecordingTranslator:
+    """Stub translate_batch that records every batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, language_pair, sentences):
+        with self.lock:
+            self.batches.append((language_pair, list(sentences)))
+        return [f"{language_pair[1]}:{sentence}" for sentence in sentences]
+
+
+def test_groups_batches_by_language_pair():
+    translator = RecordingTranslator()
+    scheduler = BatchScheduler(translator, max_batch_size=16, max_wait_ms=200)
+
+    futures = [
+        scheduler.submit(("en", "fr" if i % 2 else "de"), f"s{i}")
+        for i in range(6)
+    ]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert results == [f"{'fr' if i % 2 else 'de'}:s{i}" for i in range(6)]
+    assert sorted(pair for pair, _ in translator.batches) == [("en", "de"), ("en", "fr")]
+    for pair, sentences in translator.batches:
+        assert len(sentences) == 3
+
+
+def test_batch_is_cut_at_max_batch_size():
+    translator = RecordingTranslator()
+    scheduler = BatchScheduler(translator, max_batch_size=3, max_wait_ms=500)
+
+    futures = [scheduler.submit(("en", "fr"), f"s{i}") for i in range(7)]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert sorted(len(sentences) for _, sentences in translator.batches) == [1, 3, 3]
+
+
+def test_partial_batch_is_flushed_after_deadline():
+    translator = RecordingTranslator()
+    scheduler = BatchScheduler(translator, max_batch_size=100, max_wait_ms=20)
+
+    start = time.monotonic()
+    assert scheduler.submit(("en", "fr"), "first").result(timeout=5) == "fr:first"
+    assert time.monotonic() - start < 1
+    assert scheduler.submit(("en", "fr"), "second").result(timeout=5) == "fr:second"
+
+    assert [sentences for _, sentences in translator.batches] == [["first"], ["second"]]
+
+
+def test_batches_grow_while_workers_are_busy():
+    translator = RecordingTranslator()
+
+    def slow_batch(language_pair, sentences):
+        time.sleep(0.3)
+        return translator(language_pair, sentences)
+
+    scheduler = BatchScheduler(slow_batch, max_batch_size=16, max_wait_ms=10, num_workers=1)
+
+    futures = [scheduler.submit(("en", "fr"), "first")]
+    time.sleep(0.05)
+    # Spread over several wait windows while the only worker is busy
+    for i in range(10):
+        futures.append(scheduler.submit(("en", "fr"), f"s{i}"))
+        time.sleep(0.02)
+    for future in futures:
+        future.result(timeout=5)
+
+    assert [len(sentences) for _, sentences in translator.batches] == [1, 10]
+
+
+def test_exceptions_reach_every_future():
+    def failing_batch(language_pair, sentences):
+        raise ValueError("model failed")
+
+    scheduler = BatchScheduler(failing_batch, max_batch_size=16, max_wait_ms=50)
+    futures = [scheduler.submit(("en", "fr"), f"s{i}") for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(ValueError, match="model failed"):
+            future.result(timeout=5)
+
+
+def test_missing_outputs_fail_instead_of_hanging():
+    def short_batch(language_pair, sentences):
+        return sentences[:-1]
+
+    scheduler = BatchScheduler(short_batch, max_batch_size=16, max_wait_ms=50)
+    futures = [scheduler.submit(("en", "fr"), f"s{i}") for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="Expected 3 translations, got 2"):
+            future.result(timeout=5)
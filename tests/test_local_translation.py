@@ -0,0 +1,165 @@
+import threading
+import time
+import pytest
+import modules.local_translation as local_translation
+from modules.local_translation import LocalTranslator
+
+
+class ExclusiveTokenizer:
+    """Fake tokenizer that fails if two threads use it at the same time."""
+
+    def __init__(self):
+        self.in_use = threading.Lock()
+
+    def _enter(self):
+        if not self.in_use.acquire(blocking=False):
+            raise RuntimeError("Already borrowed")
+        time.sleep(0.05)
+        self.in_use.release()
+
+    def __call__(self, sentences, **kwargs):
+        self._enter()
+        return {"input_ids": list(sentences)}
+
+    def convert_tokens_to_ids(self, token):
+        self._enter()
+        return 0
+
+    def batch_decode(self, outputs, **kwargs):
+        self._enter()
+        return [f"translated {output}" for output in outputs]
+
+
+class EchoModel:
+    def generate(self, input_ids, **kwargs):
+        return input_ids
+
+
+def test_same_pair_batches_share_tokenizer_safely():
+    translator = LocalTranslator()
+    entry = (ExclusiveTokenizer(), threading.Lock(), EchoModel())
+    translator._load_model = lambda language_pair: entry
+
+    results = {}
+    errors = []
+
+    def run(name):
+        try:
+            results[name] = translator._translate_batch(("en", "ta"), [name])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert errors == []
+    assert results == {"a": ["translated a"], "b": ["translated b"]}
+
+
+class FakeModel:
+    def eval(self):
+        return self
+
+
+def test_slow_model_download_does_not_block_other_models(monkeypatch):
+    nllb_released = threading.Event()
+
+    def from_pretrained(model_name, **kwargs):
+        if model_name == "facebook/nllb-200-distilled-600M":
+            nllb_released.wait(timeout=5)
+        return FakeModel()
+
+    monkeypatch.setattr(local_translation.AutoModelForSeq2SeqLM, "from_pretrained", from_pretrained)
+    monkeypatch.setattr(local_translation.AutoTokenizer, "from_pretrained", lambda *a, **k: object())
+    monkeypatch.delenv("LOCAL_NLLB_MODEL", raising=False)
+
+    translator = LocalTranslator()
+    nllb_thread = threading.Thread(target=translator._load_model, args=(("en", "ta"),))
+    nllb_thread.start()
+    time.sleep(0.05)
+
+    marian_thread = threading.Thread(target=translator._load_model, args=(("en", "fr"),))
+    marian_thread.start()
+    marian_thread.join(timeout=1)
+    loaded_while_nllb_pending = not marian_thread.is_alive()
+
+    nllb_released.set()
+    nllb_thread.join(timeout=5)
+
+    assert loaded_while_nllb_pending
+    assert set(translator.models) == {
+        "facebook/nllb-200-distilled-600M",
+        "Helsinki-NLP/opus-mt-en-fr",
+    }
+
+
+def test_torch_threads_are_set_on_first_model_load(monkeypatch):
+    thread_counts = []
+    monkeypatch.setattr(local_translation.torch, "set_num_threads", thread_counts.append)
+    monkeypatch.setattr(local_translation.AutoModelForSeq2SeqLM, "from_pretrained", lambda *a, **k: FakeModel())
+    monkeypatch.setattr(local_translation.AutoTokenizer, "from_pretrained", lambda *a, **k: object())
+    monkeypatch.setenv("LOCAL_TORCH_THREADS", "3")
+
+    translator = LocalTranslator()
+    assert thread_counts == []
+
+    translator._load_model(("en", "fr"))
+    translator._load_model(("en", "ta"))
+    assert thread_counts == [3]
+
+
+def bracket_batch(self, language_pair, sentences):
+    return [f"<{sentence}>" for sentence in sentences]
+
+
+def test_translate_splits_sentences_and_keeps_lines(monkeypatch):
+    monkeypatch.setattr(LocalTranslator, "_translate_batch", bracket_batch)
+    translator = LocalTranslator()
+
+    result = translator.translate("One. Two!\n\n  Three?  ", "French")
+
+    assert result == {
+        "translation": "<One.> <Two!>\n\n<Three?>",
+        "cultural_context": "",
+        "idioms": ""
+    }
+
+
+def test_translate_returns_input_for_same_language(monkeypatch):
+    def unexpected_batch(self, language_pair, sentences):
+        raise AssertionError("no model should run")
+
+    monkeypatch.setattr(LocalTranslator, "_translate_batch", unexpected_batch)
+    translator = LocalTranslator()
+
+    assert translator.translate(" Hello. ", "english")["translation"] == "Hello."
+    assert translator.translate("Hola.", "Spanish", source_language="es")["translation"] == "Hola."
+
+
+def test_translate_rejects_unsupported_language(monkeypatch):
+    monkeypatch.setattr(LocalTranslator, "_translate_batch", bracket_batch)
+    translator = LocalTranslator()
+
+    with pytest.raises(ValueError, match="Language not supported by the local backend: klingon"):
+        translator.translate("Hello.", "Klingon")
+
+
+def test_translate_times_out_when_batches_stall(monkeypatch):
+    released = threading.Event()
+
+    def stalled_batch(self, language_pair, sentences):
+        released.wait(timeout=5)
+        return sentences
+
+    monkeypatch.setattr(LocalTranslator, "_translate_batch", stalled_batch)
+    monkeypatch.setenv("LOCAL_TIMEOUT_SECONDS", "0.2")
+    translator = LocalTranslator()
+
+    try:
+        with pytest.raises(TimeoutError, match="within 0.2 seconds"):
+            translator.translate("Hello.", "French")
+    finally:
+        released.set()
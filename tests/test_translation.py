@@ -0,0 +1,105 @@
+import httpx
+import pytest
+from groq import RateLimitError
+import modules.local_translation as local_translation
+from modules.translation import Translator
+
+
+def rate_limit_error():
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class ThrottledLLM:
+    def invoke(self, messages):
+        raise rate_limit_error()
+
+
+class FakeLocalTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def language_pair(self, target_language, source_language=None):
+        return ("en", "en" if target_language == "English" else "fr")
+
+    def translate(self, text, target_language, **kwargs):
+        self.calls.append((text, target_language))
+        return {"translation": f"local {text}", "cultural_context": "", "idioms": ""}
+
+
+@pytest.fixture
+def groq_env(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.delenv("TRANSLATION_BACKEND", raising=False)
+    monkeypatch.delenv("LOCAL_FALLBACK", raising=False)
+
+
+@pytest.fixture
+def local_translator(monkeypatch):
+    translator = FakeLocalTranslator()
+    monkeypatch.setattr(local_translation, "get_local_translator", lambda: translator)
+    return translator
+
+
+def test_rate_limit_falls_back_to_local_backend(groq_env, local_translator, monkeypatch):
+    monkeypatch.setenv("LOCAL_FALLBACK", "true")
+    translator = Translator()
+    translator.llm = ThrottledLLM()
+
+    result = translator.translate("Hello.", "French")
+
+    assert result["translation"] == "local Hello."
+    assert result["fallback"] is True
+    assert local_translator.calls == [("Hello.", "French")]
+
+
+def test_rate_limit_is_raised_without_fallback(groq_env, local_translator):
+    translator = Translator()
+    translator.llm = ThrottledLLM()
+
+    with pytest.raises(RateLimitError):
+        translator.translate("Hello.", "French")
+    assert local_translator.calls == []
+
+
+def test_fallback_never_returns_input_for_source_language_target(groq_env, local_translator, monkeypatch):
+    monkeypatch.setenv("LOCAL_FALLBACK", "true")
+    translator = Translator()
+    translator.llm = ThrottledLLM()
+
+    # The input may be Spanish, so echoing it back as English would be wrong
+    with pytest.raises(RateLimitError):
+        translator.translate("Hola.", "English")
+    assert local_translator.calls == []
+
+
+def test_local_backend_needs_no_groq_key(local_translator, monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    monkeypatch.setenv("TRANSLATION_BACKEND", "local")
+    translator = Translator()
+
+    assert translator.llm is None
+    assert translator.translate("Hello.", "French")["translation"] == "local Hello."
+
+
+def test_groq_backend_does_not_load_local_models(groq_env, local_translator):
+    translator = Translator()
+
+    assert translator.backend == "groq"
+    assert translator.local_translator is None
+
+
+def test_unknown_backend_is_rejected(groq_env, monkeypatch):
+    monkeypatch.setenv("TRANSLATION_BACKEND", "locl")
+
+    with pytest.raises(ValueError, match="Unsupported TRANSLATION_BACKEND: locl"):
+        Translator()
+
+
+def test_groq_backend_requires_api_key(monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    monkeypatch.delenv("TRANSLATION_BACKEND", raising=False)
+
+    with pytest.raises(ValueError, match="GROQ_API_KEY"):
+        Translator()